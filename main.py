@@ -1,14 +1,185 @@
+import io
 import json
+import mmap
+import os
+import queue
+import sys
+import threading
+from collections import Counter
+from collections.abc import ItemsView
+from dataclasses import dataclass
+from typing import Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+def _loads(data: bytes) -> dict:
+    """Parse serialized inventory bytes, preferring msgpack, then orjson, when installed."""
+    if msgpack is not None:
+        return msgpack.unpackb(data, raw=False)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+def _dumps(obj: dict, pretty: bool = False) -> bytes:
+    """
+    Serialize the inventory to bytes, preferring msgpack, then orjson, when installed.
+
+    Machine-written updates skip indentation; pass pretty=True for a human-readable export.
+    """
+    if msgpack is not None:
+        return msgpack.packb(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=4 if pretty else None).encode()
+
+WELCOME_BYTES = b"\nWelcome to the Inventory Management System\nThis app is made by Om Goyal.\n"
+GOODBYE_BYTES = b"Thank you for using the Inventory Management System. Goodbye!\n\n"
+INVALID_CHOICE_BYTES = b"Invalid choice. Please try again.\n"
+QUIT_TOKENS = frozenset(("q", "Q"))
+
+WAL_COMPACT_OPS = 256
+WAL_COMPACT_BYTES = 1 << 20
+
+@dataclass(slots=True)
+class Product:
+    """
+    A single product record.
+
+    Slotted attribute storage is smaller and faster to access than the 5-key
+    dicts the records used to be; the on-disk schema is unchanged and mapped
+    through from_record/to_record.
+    """
+
+    description: str
+    company: str
+    price: float
+    stock: int
+    category: str
+
+    @classmethod
+    def from_record(cls, record: dict) -> "Product":
+        # Coerce here, at the disk boundary: databases written by older versions
+        # stored Price/Stock as strings, and the read paths no longer re-validate.
+        return cls(record["Description"], record["Company"], float(record["Price"]),
+                   int(record["Stock"]), record["Category"])
+
+    def to_record(self) -> dict:
+        return {
+            "Description": self.description,
+            "Company": self.company,
+            "Price": self.price,
+            "Stock": self.stock,
+            "Category": self.category
+        }
+MMAP_MIN_SIZE = 64 * 1024
+FLUSH_COALESCE_SECONDS = 0.05
+WRITE_BUF_SOFT_MAX = 1 << 20
 
 class Inventory:
+    __slots__ = (
+        "database_path", "wal_path", "_cache", "_cache_mtime", "_name_list",
+        "_lower_index", "_categories", "_dirty", "_wal", "_wal_ops", "_wal_bytes", "_write_buf", "_lock",
+        "_flush_queue", "_writer", "_version", "_detail_cache", "_detail_cache_version",
+    )
+
     def __init__(self):
-        self.database_path = "database/products.json"
-        
-    def get_raw_inventory(self) -> dict[str, dict[str, str]]:
+        if msgpack is not None:
+            self.database_path = "database/products.msgpack"
+        else:
+            self.database_path = "database/products.json"
+
+        # Bootstrap once here so the read path never needs a FileNotFoundError branch.
+        os.makedirs(os.path.dirname(self.database_path), exist_ok=True)
+        if msgpack is not None:
+            self._migrate_json_database("database/products.json")
+        if not os.path.exists(self.database_path):
+            with open(self.database_path, "wb") as file:
+                file.write(_dumps({}))
+
+        self.wal_path = self.database_path + ".wal"
+        self._cache = None
+        self._cache_mtime = -1
+        self._name_list = None
+        self._lower_index = None
+        self._categories = None
+        self._dirty = False
+        self._wal = None
+        self._wal_ops = 0
+        self._wal_bytes = 0
+        self._version = 0
+        self._detail_cache = {}
+        self._detail_cache_version = 0
+        self._write_buf = bytearray()
+        # Reentrant so a mutator holding the lock can call _append_wal and
+        # update_raw_inventory, which take it again.
+        self._lock = threading.RLock()
+        self._flush_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._background_writer, daemon=True)
+        self._writer.start()
+
+    def _background_writer(self) -> None:
+        """
+        Function run by the background writer thread.
+
+        Drains flush requests off the interactive thread and coalesces bursts that
+        arrive within FLUSH_COALESCE_SECONDS into a single snapshot write.
+        """
+
+        running = True
+        while running:
+            request = self._flush_queue.get()
+            if request is None:
+                break
+
+            try:
+                while True:
+                    request = self._flush_queue.get(timeout=FLUSH_COALESCE_SECONDS)
+                    if request is None:
+                        running = False
+                        break
+            except queue.Empty:
+                pass
+
+            self.compact()
+
+    def close(self) -> None:
+        """
+        Function to stop the background writer and persist any pending mutations.
+        """
+
+        self._flush_queue.put(None)
+        self._writer.join()
+        self.compact()
+
+    def _migrate_json_database(self, json_path: str) -> None:
+        """
+        One-shot migration of an existing JSON database to the MessagePack file.
+
+        Only runs when the MessagePack file does not exist yet; the JSON file is left in place.
+        """
+
+        if os.path.exists(self.database_path) or not os.path.exists(json_path):
+            return
+
+        with open(json_path, "rb") as file:
+            inventory = json.loads(file.read())
+        with open(self.database_path, "wb") as file:
+            file.write(_dumps(inventory))
+
+    def get_raw_inventory(self) -> dict[str, Product]:
         """
         Function to get the inventory from the database.
 
-        The returned format will be:
+        Returns a dict mapping product names to Product records. The on-disk
+        format is:
 
     ```json
 
@@ -18,11 +189,11 @@ class Inventory:
 
             "Description": "A brief description of the product.",
 
-            "Comapny": "The name of the company that manufactures the product.",
+            "Company": "The name of the company that manufactures the product.",
 
-            "Price": "0.0",
+            "Price": 0.0,
 
-            "Stock": "0",
+            "Stock": 0,
 
             "Category": "The category of the product; e.g. AC, Battery, TV etc."
 
@@ -34,18 +205,111 @@ class Inventory:
         """
 
         try:
-            with open(self.database_path, "r") as file:
-                inventory = file.read()
-            return json.loads(inventory)
-        except json.JSONDecodeError:
+            stat = os.stat(self.database_path)
+            if stat.st_mtime_ns == self._cache_mtime and self._cache is not None:
+                return self._cache
+
+            with self._lock:
+                # Re-check under the lock: between the unlocked stat and here the
+                # writer may have replaced the snapshot but not yet truncated the
+                # WAL, and replaying it onto that snapshot would double-apply.
+                stat = os.stat(self.database_path)
+                if stat.st_mtime_ns == self._cache_mtime and self._cache is not None:
+                    return self._cache
+
+                with open(self.database_path, "rb") as file:
+                    if stat.st_size >= MMAP_MIN_SIZE:
+                        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            raw = _loads(memoryview(mapped))
+                    else:
+                        raw = _loads(file.read())
+                self._cache = {name: Product.from_record(record) for name, record in raw.items()}
+                self._cache_mtime = stat.st_mtime_ns
+                self._name_list = None
+                self._lower_index = None
+                self._categories = None
+                self._version += 1
+                self._replay_wal(self._cache)
+                return self._cache
+        except ValueError:
             print("Error decoding JSON from the database. Please check the file format.")
             return {}
 
+    def _append_wal(self, record: dict) -> None:
+        """
+        Function to append one mutation record to the write-ahead log.
+
+        Keeps a single mutation down to one small append instead of rewriting the
+        whole database; the log is compacted into a snapshot every WAL_COMPACT_OPS records.
+        """
+
+        with self._lock:
+            if self._wal is None:
+                self._wal = open(self.wal_path, "ab")
+
+            line = json.dumps(record).encode() + b"\n"
+            os.write(self._wal.fileno(), line)
+            self._wal_ops += 1
+            self._wal_bytes += len(line)
+            self._dirty = True
+            self._version += 1
+
+        if self._wal_ops >= WAL_COMPACT_OPS or self._wal_bytes >= WAL_COMPACT_BYTES:
+            self._flush_queue.put(True)
+
+    def _replay_wal(self, inventory: dict) -> None:
+        """
+        Function to replay pending write-ahead-log records onto a freshly loaded inventory.
+
+        Called after a cold load so mutations logged before a crash or compaction are not lost.
+        """
+
+        try:
+            with open(self.wal_path, "rb") as wal:
+                records = wal.read().splitlines()
         except FileNotFoundError:
-            print("Database file not found. Please ensure the database path is correct.")
-            with open(self.database_path, "w") as file:
-                file.write(json.dumps({}, indent=4))
-            return {}
+            return
+
+        for line in records:
+            if not line:
+                continue
+            record = json.loads(line)
+            if record["op"] == "set":
+                inventory[record["name"]] = Product.from_record(record["entry"])
+            elif record["op"] == "del":
+                inventory.pop(record["name"], None)
+            elif record["op"] == "sell":
+                entry = self._find_entry(record["name"], inventory)
+                if entry is not None:
+                    entry.stock -= record["quantity"]
+
+        if records:
+            self._dirty = True
+            self._wal_ops = len(records)
+            self._wal_bytes = sum(len(line) + 1 for line in records)
+            self._name_list = None
+            self._lower_index = None
+            self._categories = None
+            self._version += 1
+
+    def compact(self) -> None:
+        """
+        Function to fold the write-ahead log into the snapshot file.
+
+        Writes the cached inventory and truncates the log; called on quit and
+        automatically once the log grows past WAL_COMPACT_OPS records.
+        """
+
+        self.flush_dirty()
+
+    def iter_items(self) -> ItemsView[str, Product]:
+        """
+        Function to iterate over (product name, product details) pairs.
+
+        Loads the inventory once, so loops over it do not re-read the database per product.
+        """
+
+        return self.get_raw_inventory().items()
 
     def get_all_products_names(self) -> list[str]:
         """
@@ -55,25 +319,51 @@ class Inventory:
         """
 
         inventory = self.get_raw_inventory()
-        return list(inventory.keys())
+        if self._name_list is None:
+            self._name_list = list(inventory.keys())
+        return self._name_list
+
+    def _find_entry(self, product_name: str, inventory: dict) -> Product | None:
+        """
+        Function to look up a product entry, falling back to a case-insensitive match.
+
+        The lowercase index is rebuilt only when the cache changes, so both the exact
+        and the fallback lookup stay O(1).
+        """
+
+        entry = inventory.get(product_name)
+        if entry is not None:
+            return entry
+
+        if self._lower_index is None:
+            self._lower_index = {name.lower(): name for name in inventory}
+
+        canonical = self._lower_index.get(product_name.lower())
+        if canonical is None:
+            return None
+        return inventory.get(canonical)
+
+    def get_name_by_index(self, index: int) -> str:
+        """
+        Function to get the product name at the given insertion-order index.
+
+        Uses the cached name list, so index-based selection does not rebuild it per call.
+        """
 
-    def get_price_of_product(self, product_name: str) -> float:
+        return self.get_all_products_names()[index]
+
+    def get_price_of_product(self, product_name: str) -> float | str:
         """
         Function to get the price of a product.
 
         Returns the price of the product if it exists, otherwise returns None.
         """
 
-        inventory = self.get_raw_inventory()
-        if not product_name in inventory:
+        entry = self.get_details_of_product(product_name)
+        if entry is None:
             return "Product not found."
-        
-        try:
-            price = float(inventory[product_name]["Price"])
-        except ValueError:
-            return "Invalid price value. Please check the product data."
-        
-        return price
+
+        return entry.price
         
     def get_stock_of_product(self, product_name: str) -> int | str:
         """
@@ -82,74 +372,136 @@ class Inventory:
         Returns the stock of the product if it exists, otherwise returns None.
         """
 
-        inventory = self.get_raw_inventory()
-        if not product_name in inventory:
+        entry = self._find_entry(product_name, self.get_raw_inventory())
+        if entry is None:
             return "Product not found."
-        
-        try:
-            stock =  int(inventory[product_name]["Stock"])
-        except ValueError:
-            return "Invalid stock value. Please check the product data."
-        
+
+        stock = entry.stock
+
         if stock == 0 or stock < 0:
             return "Product is out of stock."
         
         return stock
     
-    def get_details_of_product(self, product_name: str) -> dict[str, str] | None:
+    def get_details_of_product(self, product_name: str) -> Product | None:
         """
         Function to get the details of a product.
 
-        Returns a dictionary with the product details if it exists, otherwise returns None.
+        Returns the Product record if it exists, otherwise returns None.
+
+        Lookups are memoized against a version counter that every mutation bumps,
+        so repeated queries inside one handler resolve from the memo.
         """
 
         inventory = self.get_raw_inventory()
-        if not product_name in inventory:
-            return None
-        
-        return inventory[product_name]
 
-    def update_raw_inventory(self, new_inventory: dict[str, dict[str, str]]) -> None:
+        if self._detail_cache_version != self._version:
+            self._detail_cache = {}
+            self._detail_cache_version = self._version
+
+        try:
+            return self._detail_cache[product_name]
+        except KeyError:
+            entry = self._find_entry(product_name, inventory)
+            self._detail_cache[product_name] = entry
+            return entry
+
+    def update_raw_inventory(self, new_inventory: dict[str, Product], pretty: bool = False) -> None:
         """
         Function to update the inventory with a new inventory.
 
-        The new inventory should be in the same format as the one returned by get_raw_inventory.
+        The new inventory should be in the same format as the one returned by
+        get_raw_inventory. Pass pretty=True to write an indented, human-readable file.
         """
 
-        with open(self.database_path, "w") as file:
-            file.write(json.dumps(new_inventory, indent=4))
+        with self._lock:
+            records = {name: product.to_record() for name, product in new_inventory.items()}
+            self._write_buf[:] = _dumps(records, pretty=pretty)
+
+            temp_path = self.database_path + ".tmp"
+            with open(temp_path, "wb") as file:
+                file.write(self._write_buf)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.database_path)
+
+            if len(self._write_buf) > WRITE_BUF_SOFT_MAX:
+                self._write_buf = bytearray()
+
+            self._cache = new_inventory
+            self._cache_mtime = os.stat(self.database_path).st_mtime_ns
+            self._name_list = None
+            self._lower_index = None
+            self._categories = None
+            self._version += 1
+            self._dirty = False
+
+            if self._wal is not None:
+                self._wal.truncate(0)
+            elif os.path.exists(self.wal_path):
+                os.remove(self.wal_path)
+            self._wal_ops = 0
+            self._wal_bytes = 0
+
+    def flush_dirty(self) -> None:
+        """
+        Function to write the cached inventory to disk if it has unflushed mutations.
+
+        Does nothing when there is nothing to flush, so it is safe to call after every user action.
+
+        Runs under the lock so the writer thread never serializes the cache
+        while the interactive thread is in the middle of mutating it.
+        """
+
+        with self._lock:
+            if not self._dirty:
+                return
 
-    def add_product(self, product_name: str, description: str, company: str, price: float | str, stock: str, category: str, raw_stock_value: bool = False) -> None:
+            if self._cache is None:
+                self.get_raw_inventory()
+            if self._cache is not None:
+                self.update_raw_inventory(self._cache)
+
+    def add_product(self, product_name: str, description: str, company: str, price: float | str, stock: int | str, category: str, raw_stock_value: bool = False) -> None:
         """
         The product will be added with the given name, description, company, price, and stock.
         If the product already exists, it will increment the stock and notify the user about it.
+
+        Price and stock are validated here, at the ingest boundary, so a bad value
+        fails before anything is mutated and the read paths never re-validate.
         """
 
-        inventory = self.get_raw_inventory()
-        
-        if product_name in inventory:
-            inventory[product_name]["Description"] = description
-            inventory[product_name]["Company"] = company
-            inventory[product_name]["Price"] = str(price)
-            
-            if raw_stock_value:
-                inventory[product_name]["Stock"] = stock
+        price = float(price)
+        stock = int(stock)
+
+        with self._lock:
+            inventory = self.get_raw_inventory()
+            entry = inventory.get(product_name)
+
+            if entry is not None:
+                new_stock = stock if raw_stock_value else entry.stock + stock
+
+                if (entry.description == description and entry.company == company
+                        and entry.price == price and entry.category == category
+                        and entry.stock == new_stock):
+                    print(f"Product '{product_name}' is already up to date; nothing to write.")
+                    return
+
+                self._track_category(entry.category, category)
+                entry.description = description
+                entry.company = company
+                entry.price = price
+                entry.stock = new_stock
+                entry.category = category
+                print(f"Product '{product_name}' already exists. Stock has been updated.")
+                print(f"New stock for '{product_name}': {entry.stock}")
             else:
-                inventory[product_name]["Stock"] = int(inventory[product_name]["Stock"]) + int(stock)
-            
-            inventory[product_name]["Category"] = category
-            print(f"Product '{product_name}' already exists. Stock has been updated.")
-            print(f"New stock for '{product_name}': {inventory[product_name]['Stock']}")
-        else:
-            inventory[product_name] = {
-                "Description": description,
-                "Company": company,
-                "Price": str(price),
-                "Stock": str(stock),
-                "Category": category
-            }
-        
-        self.update_raw_inventory(inventory)
+                inventory[product_name] = Product(description, company, price, stock, category)
+                self._name_list = None
+                self._lower_index = None
+                self._track_category(None, category)
+
+            self._append_wal({"op": "set", "name": product_name, "entry": inventory[product_name].to_record()})
 
     def sell_product(self, product_name: str, quantity: int) -> str:
         """
@@ -159,21 +511,69 @@ class Inventory:
         If the product does not exist or has insufficient stock, it will return an error message.
         """
 
-        inventory = self.get_raw_inventory()
-        
-        if product_name not in inventory:
-            return "Product not found."
-        
-        current_stock = int(inventory[product_name]["Stock"])
-        
-        if current_stock < quantity:
-            return "Insufficient stock available."
-        
-        inventory[product_name]["Stock"] = str(current_stock - quantity)
-        self.update_raw_inventory(inventory)
-        
-        return f"Sold {quantity} of '{product_name}'. New stock: {inventory[product_name]['Stock']}"
+        with self._lock:
+            inventory = self.get_raw_inventory()
+            entry = self._find_entry(product_name, inventory)
+
+            if entry is None:
+                return "Product not found."
+
+            current_stock = entry.stock
+
+            if current_stock < quantity:
+                return "Insufficient stock available."
+
+            if quantity == 0:
+                return f"Sold 0 of '{product_name}'. New stock: {current_stock}"
+
+            entry.stock = current_stock - quantity
+            self._append_wal({"op": "sell", "name": product_name, "quantity": quantity})
+
+            return f"Sold {quantity} of '{product_name}'. New stock: {entry.stock}"
     
+    def increase_stock(self, product_name: str, delta: int) -> int | str:
+        """
+        Function to increase the stock of an existing product by delta units.
+
+        Mutates the entry in place and logs one set record, so the whole flow
+        costs a single lookup instead of separate stock/details/price queries.
+        Returns the new stock, or an error message if the product is missing.
+        """
+
+        with self._lock:
+            inventory = self.get_raw_inventory()
+            entry = self._find_entry(product_name, inventory)
+
+            if entry is None:
+                return "Product not found."
+
+            if delta:
+                entry.stock += delta
+                self._append_wal({"op": "set", "name": product_name, "entry": entry.to_record()})
+
+            return entry.stock
+
+    def rename_product(self, old_name: str, new_name: str) -> bool:
+        """
+        Function to rename a product while keeping its details.
+
+        Returns True on success, or False when the old name does not exist or the
+        new name is already taken.
+        """
+
+        with self._lock:
+            inventory = self.get_raw_inventory()
+            if old_name not in inventory or new_name in inventory:
+                return False
+
+            entry = inventory.pop(old_name)
+            inventory[new_name] = entry
+            self._name_list = None
+            self._lower_index = None
+            self._append_wal({"op": "del", "name": old_name})
+            self._append_wal({"op": "set", "name": new_name, "entry": entry.to_record()})
+            return True
+
     def get_all_categories(self) -> list[str]:
         """
         Function to get all categories from the inventory.
@@ -182,17 +582,39 @@ class Inventory:
         """
 
         inventory = self.get_raw_inventory()
-        categories = set()
 
-        for product in inventory.values():
-            categories.add(product["Category"])
+        if self._categories is None:
+            self._categories = Counter(product.category for product in inventory.values())
+
+        return list(self._categories)
+
+    def _track_category(self, old_category: str | None, new_category: str | None) -> None:
+        """
+        Function to keep the category refcount index in step with a mutation.
+
+        Does nothing while the index has not been built yet; it will be rebuilt
+        from the inventory on the next get_all_categories call.
+        """
+
+        if self._categories is None or old_category == new_category:
+            return
+
+        if old_category is not None:
+            count = self._categories.get(old_category, 0) - 1
+            if count > 0:
+                self._categories[old_category] = count
+            else:
+                self._categories.pop(old_category, None)
 
-        return list(categories)
+        if new_category is not None:
+            self._categories[new_category] = self._categories.get(new_category, 0) + 1
 
 class UserInteractionViaTerminal:
+    __slots__ = ("inventory", "options", "options_list", "_menu_bytes", "_dispatch", "_buf")
+
     def __init__(self):
         self.inventory = Inventory()
-        self.options: dict[str, function] = {
+        self.options: dict[str, Callable[[], None]] = {
             "View all products": self.option_view_all_products,
             "Add a product": self.option_add_product,
             "Sell a product": self.option_sell_product,
@@ -202,53 +624,60 @@ class UserInteractionViaTerminal:
             "Update details of a product": self.option_update_product_details
         }
         self.options_list = list(self.options.keys())
+        self._dispatch = {str(index): action for index, action in enumerate(self.options.values(), start=1)}
+        menu_lines = ["Available options:"]
+        menu_lines.extend(f"{index}. {option}" for index, option in enumerate(self.options_list, start=1))
+        menu_lines.append("Type 'q' to quit\n")
+        self._menu_bytes = "\n".join(menu_lines).encode()
+        self._buf = io.StringIO()
+
+    def _emit(self, *lines: str) -> None:
+        """
+        Function to write a block of output lines in a single stdout write.
+
+        Reuses one StringIO buffer across calls instead of allocating a fresh
+        string per line for every listing.
+        """
+
+        self._buf.seek(0)
+        self._buf.truncate()
+        self._buf.write("\n".join(lines))
+        self._buf.write("\n")
+        sys.stdout.write(self._buf.getvalue())
 
     def printOptions(self) -> None:
         """
         Function to print the available options for the user.
         """
-        print("Available options:")
-        for index, option in enumerate(self.options_list, start=1):
-            print(f"{index}. {option}")
-        print("Type 'q' to quit")
+        sys.stdout.buffer.write(self._menu_bytes)
 
-    def run(self):
-        print("\nWelcome to the Inventory Management System")
-        print("This app is made by Om Goyal.")
+    def run(self) -> None:
+        sys.stdout.buffer.write(WELCOME_BYTES)
         while True:
             input("Press enter to continue\n")
             self.printOptions()
             
             choice = input("Enter your choice: ")
-            if choice.lower() == 'q':
-                print("Thank you for using the Inventory Management System. Goodbye!\n")
+            if choice in QUIT_TOKENS:
+                self.inventory.close()
+                sys.stdout.buffer.write(GOODBYE_BYTES)
                 break
 
-            try:
-                choice = int(choice)
-            except ValueError:
-                print("Invalid input. Please enter a number corresponding to the option or 'q' to quit.")
-
             print("\n")
 
-            self.handleUserInput(choice)  
+            self.handleUserInput(choice)
 
-    def handleUserInput(self, choice: int) -> None:
-        choice = choice - 1  # Adjust for zero-based index
-        if choice < 0 or choice >= len(self.options_list):
-            print("Invalid choice. Please try again.")
+    def handleUserInput(self, choice: str) -> None:
+        action = self._dispatch.get(choice)
+        if action is None:
+            sys.stdout.buffer.write(INVALID_CHOICE_BYTES)
             return
 
-        option_name = self.options_list[choice]
-        action = self.options[option_name]
         action()  # Call the corresponding method for the selected option
 
     def option_view_all_products(self) -> None:
-        products = self.inventory.get_all_products_names()
-        print("Available products:")
-        for product in products:
-            stock = self.inventory.get_stock_of_product(product)
-            print(f"- {product}: {stock} in stock")
+        self._emit("Available products:",
+                   *(f"- {name}: {details.stock} in stock" for name, details in self.inventory.iter_items()))
 
     def option_add_product(self) -> None:
         name = input("Enter product name: ")
@@ -256,11 +685,9 @@ class UserInteractionViaTerminal:
         company = input("Enter company name: ")
         price = float(input("Enter product price: "))
         stock = input("Enter stock quantity: ")
-        formatted_categories = ""
-        for category in self.inventory.get_all_categories():
-            formatted_categories += f"- {category}\n"
-        
-        print(f"Available categories:\n{formatted_categories}")
+        formatted_categories = "\n".join(f"- {category}" for category in self.inventory.get_all_categories())
+
+        print(f"Available categories:\n{formatted_categories}\n")
         print("Please enter the category of the product from the above list or a new category.")
         category = input("Enter product category: ")
         self.inventory.add_product(name, description, company, price, stock, category)
@@ -274,25 +701,28 @@ class UserInteractionViaTerminal:
             print("Invalid product index. Please try again.")
             return
         
-        name = all_products[int(name)]
+        name = self.inventory.get_name_by_index(int(name))
         print(f"Selected product: {name} with stock {self.inventory.get_stock_of_product(name)}")
         quantity = int(input("Enter quantity to sell: "))
         result = self.inventory.sell_product(name, quantity)
         print(result)
         
     def option_view_price_of_all_products(self) -> None:
-        all_products = self.inventory.get_all_products_names()
-        print("Price of all products:")
-        for product in all_products:
-            price = self.inventory.get_price_of_product(product)
-            print(f"- {product}: {price}")
+        self._emit("Price of all products:",
+                   *(f"- {name}: {details.price}" for name, details in self.inventory.iter_items()))
 
     def option_view_product_details(self) -> None:
+        inventory = self.inventory.get_raw_inventory()
         all_products = self.inventory.get_all_products_names()
-        print("Price of all products:")
-        for product in all_products:
-            price = self.inventory.get_price_of_product(product)
-            print(f"{product}: {price}")
+        self.printAllProducts()
+
+        index = input("Enter the index of the product to view details: ")
+        if not index.isdigit() or not 0 <= int(index) < len(all_products):
+            print("Invalid product index. Please try again.")
+            return
+
+        product_name = all_products[int(index)]
+        self._print_details(product_name, inventory[product_name])
 
     def option_increase_stock_of_product(self) -> None:
         self.printAllProducts()
@@ -307,21 +737,20 @@ class UserInteractionViaTerminal:
             print("Invalid index. Please try again.")
             return
                 
-        product_name = all_products[product_index]
-        current_stock = self.inventory.get_stock_of_product(product_name)
-        print(f"Selected product: {product_name} with current stock {current_stock}")
+        product_name = self.inventory.get_name_by_index(product_index)
+        product_details = self.inventory.get_details_of_product(product_name)
+        if product_details is None:
+            print(f"Product '{product_name}' not found in the inventory.")
+            return
+
+        print(f"Selected product: {product_name} with current stock {product_details.stock}")
         stock_increase = int(input(f"Enter the amount to increase stock for '{product_name}': "))
         if stock_increase < 0:
             print("Stock increase cannot be negative. Please try again.")
             return
 
-        product_details = self.inventory.get_details_of_product(product_name)
-        self.inventory.add_product(product_name, 
-                                  product_details["Description"],
-                                  product_details["Company"],
-                                  self.inventory.get_price_of_product(product_name),
-                                  stock_increase,
-                                  product_details["Category"])
+        new_stock = self.inventory.increase_stock(product_name, stock_increase)
+        print(f"New stock for '{product_name}': {new_stock}")
         
     def option_update_product_details(self) -> None:
         self.printAllProducts()
@@ -331,15 +760,19 @@ class UserInteractionViaTerminal:
             print("Invalid index. Please try again.")
             return
                 
-        product_name = all_products[product_index]
+        product_name = self.inventory.get_name_by_index(product_index)
         print(f"Selected product: {product_name}")
-        product_name = input(f"Enter new product name (or press Enter to keep {product_name}): ") or product_name
         product_details = self.inventory.get_details_of_product(product_name)
-        old_description = product_details["Description"]
-        old_company = product_details["Company"]
-        old_price = self.inventory.get_price_of_product(product_name)
-        old_stock = product_details["Stock"]
-        old_category = product_details["Category"]
+        if product_details is None:
+            print(f"Product '{product_name}' not found in the inventory.")
+            return
+
+        new_name = input(f"Enter new product name (or press Enter to keep {product_name}): ") or product_name
+        old_description = product_details.description
+        old_company = product_details.company
+        old_price = product_details.price
+        old_stock = product_details.stock
+        old_category = product_details.category
 
         description = input(f"Enter new product description (or press Enter to keep '{old_description}'): ") or old_description
         company = input(f"Enter new company name (or press Enter to keep '{old_company}'): ") or old_company
@@ -361,7 +794,11 @@ class UserInteractionViaTerminal:
                 
         category = input(f"Enter new product category (or press Enter to keep '{old_category}'): ") or old_category
 
-        self.inventory.add_product(product_name, description, company, price_input, stock, category, raw_stock_value=True)
+        if new_name != product_name and not self.inventory.rename_product(product_name, new_name):
+            print(f"Cannot rename '{product_name}' to '{new_name}'; that name is already taken.")
+            return
+
+        self.inventory.add_product(new_name, description, company, price_input, stock, category, raw_stock_value=True)
 
     def viewProductDetails(self, product_name: str) -> None:
         """
@@ -374,18 +811,27 @@ class UserInteractionViaTerminal:
             print(f"Product '{product_name}' not found in the inventory.")
             return
 
-        print(f"Details of '{product_name}':\n")
-        print(f"Description: {product_details['Description']}")
-        print(f"Company: {product_details['Company']}")
-        print(f"Price: {product_details['Price']}")
-        print(f"Stock: {product_details['Stock']}")
-        print(f"Category: {product_details['Category']}")
+        self._print_details(product_name, product_details)
+
+    def _print_details(self, product_name: str, product_details: Product) -> None:
+        """
+        Function to print the details of an already-fetched product entry.
+
+        Takes the record directly so callers that hold the inventory do not look it up again.
+        """
+
+        self._emit(f"Details of '{product_name}':",
+                   "",
+                   f"Description: {product_details.description}",
+                   f"Company: {product_details.company}",
+                   f"Price: {product_details.price}",
+                   f"Stock: {product_details.stock}",
+                   f"Category: {product_details.category}")
 
     def printAllProducts(self) -> None:
         all_products = self.inventory.get_all_products_names()
 
-        for index, product in enumerate(all_products):
-            print(f"{index}: {product}")
+        self._emit(*(f"{index}: {product}" for index, product in enumerate(all_products)))
 
 def main():
     user_interaction = UserInteractionViaTerminal()